@@ -7,17 +7,25 @@ to work with N8N Cloud workflows.
 """
 
 import asyncio
-import json
 import logging
 import os
+import queue
+import signal
+import sys
+import threading
 import time
-from datetime import datetime
-from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, List, Optional
 
 from fastapi import FastAPI, Request, Response, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+import msgspec
+import orjson
 import uvicorn
+from uvicorn.config import LOG_LEVELS
 
 from product_hunt_mcp.tools.collections import register_collection_tools
 from product_hunt_mcp.tools.comments import register_comment_tools
@@ -29,225 +37,526 @@ from product_hunt_mcp.tools.users import register_user_tools
 # fastmcp is an external dependency
 from fastmcp import FastMCP
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, 
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+class JSONFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, option=orjson.OPT_UTC_Z).decode()
+
+class LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler for a listener in the same process.
+
+    Records are enqueued unmodified instead of being pre-formatted, so the
+    real handlers' formatters still see ``exc_info`` and the original
+    ``args`` (which uvicorn's access log formatter relies on).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def read_log_level() -> str:
+    """Return the LOG_LEVEL environment variable, validated against uvicorn's level names."""
+    level = os.getenv("LOG_LEVEL", "info").strip().lower()
+    if level not in LOG_LEVELS:
+        raise ValueError(
+            f"Invalid LOG_LEVEL {level!r}; expected one of: {', '.join(LOG_LEVELS)}"
+        )
+    return level
+
+# Log level for this module and uvicorn, e.g. LOG_LEVEL=warning in production
+LOG_LEVEL = read_log_level()
+
+def json_stderr_handler() -> logging.Handler:
+    """Return a stderr handler that writes JSON lines."""
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JSONFormatter())
+    return handler
+
+def configure_logging() -> None:
+    """Log JSON lines to stderr at LOG_LEVEL, unless logging is already configured."""
+    logging.basicConfig(level=LOG_LEVELS[LOG_LEVEL], handlers=[json_stderr_handler()])
+
+@contextmanager
+def queued_logging(*logger_names: str):
+    """
+    Move the handlers of the given loggers behind a queue for the duration of the block.
+
+    Records are enqueued on the calling thread and written by a background
+    QueueListener, so the event loop never blocks on log I/O. Each logger's
+    original handlers are restored, and pending records flushed, on exit.
+    Loggers without handlers of their own are left alone.
+    """
+    swapped = []
+    try:
+        for name in logger_names:
+            target = logging.getLogger(name)
+            if not target.handlers:
+                continue
+            handlers = target.handlers[:]
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            target.handlers = [LocalQueueHandler(log_queue)]
+            swapped.append((target, handlers, listener))
+            listener.start()
+        yield
+    finally:
+        for target, handlers, listener in swapped:
+            target.handlers = handlers
+            listener.stop()
+
 logger = logging.getLogger("ph_mcp.http_server")
 
-# Global MCP server instance
-mcp_server = None
+# Seconds between SSE heartbeat frames
+HEARTBEAT_INTERVAL = 30
+
+# Idle keep-alive timeout (seconds) for client connections
+KEEP_ALIVE_TIMEOUT = 75
 
-def initialize_mcp_server():
-    """Initialize the MCP server with all tools."""
-    global mcp_server
+def initialize_mcp_server(app: FastAPI):
+    """Initialize the MCP server with all tools and attach it to ``app.state.mcp``."""
+    server = getattr(app.state, "mcp", None)
     
-    if mcp_server is None:
+    if server is None:
         logger.info("Initializing Product Hunt MCP server...")
-        mcp_server = FastMCP("Product Hunt MCP 🚀")
+        server = FastMCP("Product Hunt MCP 🚀")
         
         # Register all tools
-        register_server_tools(mcp_server)
-        register_post_tools(mcp_server)
-        register_comment_tools(mcp_server)
-        register_collection_tools(mcp_server)
-        register_topic_tools(mcp_server)
-        register_user_tools(mcp_server)
+        register_server_tools(server)
+        register_post_tools(server)
+        register_comment_tools(server)
+        register_collection_tools(server)
+        register_topic_tools(server)
+        register_user_tools(server)
         
+        app.state.mcp = server
         logger.info("Product Hunt MCP server initialized successfully")
     
-    return mcp_server
+    return server
+
+# Serialize numpy arrays, naive datetimes (as UTC) and non-str dict keys natively,
+# falling back to str() for anything orjson does not support
+ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NAIVE_UTC
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_UTC_Z
+)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS, default=str)
+
+def sse_frame(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload as a single SSE ``data:`` frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+class ConnectionFrame(msgspec.Struct, kw_only=True):
+    """First SSE frame sent to a newly connected client."""
+    type: str = "connection"
+    message: str = "Connected to Product Hunt MCP"
+    timestamp: datetime
+
+class Heartbeat(msgspec.Struct, kw_only=True):
+    """Periodic keep-alive SSE frame."""
+    type: str = "heartbeat"
+    timestamp: datetime
+    status: str = "alive"
+
+class ErrorFrame(msgspec.Struct, kw_only=True):
+    """SSE frame reporting a stream error to the client."""
+    type: str = "error"
+    message: str
+    timestamp: datetime
+
+# Shared encoder for the typed SSE frames above
+frame_encoder = msgspec.json.Encoder()
+
+def sse_struct_frame(frame: msgspec.Struct) -> bytes:
+    """Encode a typed frame as a single SSE ``data:`` frame."""
+    return b"data: " + frame_encoder.encode(frame) + b"\n\n"
+
+def make_json_response(body: bytes) -> Response:
+    """Wrap an already-serialized JSON body in a response without re-encoding it."""
+    return Response(content=body, media_type="application/json")
+
+def with_timestamp(static_body: bytes) -> bytes:
+    """Append a current ``timestamp`` field to a pre-serialized JSON object."""
+    now = orjson.dumps(datetime.now(timezone.utc), option=orjson.OPT_UTC_Z)
+    return static_body[:-1] + b',"timestamp":' + now + b"}"
+
+# Static parts of the / and /health bodies, serialized once at import time
+ROOT_STATIC = orjson.dumps({
+    "service": "Product Hunt MCP HTTP Server",
+    "version": "0.1.0",
+    "status": "running",
+    "endpoints": {
+        "/": "Server information",
+        "/health": "Health check",
+        "/sse/": "Server-Sent Events endpoint for N8N",
+        "/tools": "List available tools",
+        "/tools/{tool_name}": "Execute specific tool"
+    }
+})
+
+HEALTHY_STATIC = orjson.dumps({
+    "status": "healthy",
+    "mcp_server": "initialized",
+    "product_hunt_token": "configured"
+})
+
+def collect_tools(server) -> List[Dict[str, str]]:
+    """Return the name and description of every tool registered on the MCP server."""
+    tools = []
+    if server and hasattr(server, 'tools'):
+        for tool_name, tool_info in server.tools.items():
+            tools.append({
+                "name": tool_name,
+                "description": getattr(tool_info, 'description', 'No description available')
+            })
+    
+    return tools
+
+def build_sse_preamble(tools: List[Dict[str, str]]) -> bytes:
+    """
+    Build the static frames sent to every SSE client after the connection message.
+
+    The server info, tool list and sample data do not change after startup, so
+    they are serialized once and replayed as-is on each new connection.
+    """
+    frames = [
+        {'type': 'server_info', 'data': {'name': 'Product Hunt MCP', 'version': '0.1.0', 'status': 'ready'}}
+    ]
+    
+    if tools:
+        frames.append({'type': 'tools', 'data': tools})
+    
+    frames.append({
+        "type": "product_hunt_data",
+        "data": {
+            "message": "Product Hunt MCP server is ready",
+            "available_tools": ["get_posts", "get_post_details", "search_topics", "get_user", "get_collections", "get_comments"],
+            "status": "operational"
+        }
+    })
+    
+    return b"".join(sse_frame(frame) for frame in frames)
+
+async def acquire_sse_slot(state) -> None:
+    """Wait until the number of active SSE streams is below ``state.sse_max``, then claim a slot."""
+    async with state.sse_cond:
+        while state.sse_active >= state.sse_max:
+            await state.sse_cond.wait()
+        state.sse_active += 1
+
+async def release_sse_slot(state) -> None:
+    """Release an SSE slot and wake one waiting stream."""
+    async with state.sse_cond:
+        state.sse_active -= 1
+        state.sse_cond.notify(1)
+
+class SSEResponse(StreamingResponse):
+    """
+    Streaming response that holds an SSE admission slot until it is over.
+
+    The slot is released here rather than in the body iterator, because the
+    iterator never starts if the client is gone before the headers are sent.
+    """
+
+    def __init__(self, content, *, state, **kwargs):
+        super().__init__(content, **kwargs)
+        self.state = state
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await release_sse_slot(self.state)
+
+async def broadcast_heartbeats(state) -> None:
+    """
+    Publish one shared heartbeat frame to all SSE streams every HEARTBEAT_INTERVAL seconds.
+
+    The frame is serialized once per tick into ``state.last_heartbeat`` and
+    subscribers are woken through ``state.heartbeat_bus``. Ticks with no
+    connected streams are skipped entirely.
+    """
+    heartbeat = Heartbeat(timestamp=datetime.now(timezone.utc))
+    while True:
+        try:
+            await asyncio.wait_for(state.shutdown.wait(), timeout=HEARTBEAT_INTERVAL)
+            return
+        except asyncio.TimeoutError:
+            pass
+        
+        if not state.sse_active:
+            continue
+        
+        heartbeat.timestamp = datetime.now(timezone.utc)
+        state.last_heartbeat = sse_struct_frame(heartbeat)
+        state.heartbeat_bus.set()
+        state.heartbeat_bus.clear()
+
+def chain_shutdown_signals(shutdown: asyncio.Event) -> Dict[int, Any]:
+    """
+    Set ``shutdown`` as soon as the process receives SIGINT/SIGTERM.
+
+    uvicorn only runs the lifespan teardown once every open response has
+    finished, so open SSE streams would otherwise keep the server from ever
+    stopping. The server's own signal handlers are still called afterwards.
+    Returns the replaced handlers so they can be restored.
+    """
+    # Signal handlers can only be installed from the main thread
+    if threading.current_thread() is not threading.main_thread():
+        return {}
+    
+    loop = asyncio.get_running_loop()
+    previous_handlers = {}
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        previous = signal.getsignal(sig)
+        
+        def handler(signum, frame, previous=previous):
+            loop.call_soon_threadsafe(shutdown.set)
+            if callable(previous):
+                previous(signum, frame)
+            elif previous == signal.SIG_DFL:
+                signal.signal(signum, signal.SIG_DFL)
+                signal.raise_signal(signum)
+        
+        signal.signal(sig, handler)
+        previous_handlers[sig] = previous
+    
+    return previous_handlers
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the MCP server and cache its static views before serving requests."""
+    configure_logging()
+    
+    # Root plus uvicorn's own loggers, which do not propagate to root
+    with queued_logging("", "uvicorn", "uvicorn.access"):
+        app.state.ph_token = os.getenv("PRODUCT_HUNT_TOKEN")
+        if not app.state.ph_token and os.getenv("STRICT_STARTUP") == "1":
+            raise RuntimeError("PRODUCT_HUNT_TOKEN not configured")
+        
+        server = initialize_mcp_server(app)
+        app.state.tools_cache = collect_tools(server)
+        app.state.tools_json = orjson.dumps({
+            "tools": app.state.tools_cache,
+            "count": len(app.state.tools_cache)
+        })
+        app.state.sse_preamble = build_sse_preamble(app.state.tools_cache)
+        app.state.shutdown = asyncio.Event()
+        # Admission control for /sse/: a counter guarded by a condition, so the
+        # limit can be changed at runtime (unlike an asyncio.Semaphore)
+        app.state.sse_cond = asyncio.Condition()
+        app.state.sse_active = 0
+        app.state.sse_max = int(os.getenv("SSE_MAX", "512"))
+        # A single broadcaster produces the heartbeat frame for every stream
+        app.state.heartbeat_bus = asyncio.Event()
+        app.state.last_heartbeat = b""
+        heartbeat_task = asyncio.create_task(broadcast_heartbeats(app.state))
+        previous_handlers = {}
+        try:
+            # End open SSE streams as soon as the server starts shutting down
+            previous_handlers = chain_shutdown_signals(app.state.shutdown)
+            yield
+        finally:
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+            # Also covers shutdowns that were not triggered by a signal
+            app.state.shutdown.set()
+            await heartbeat_task
 
 # Create FastAPI app
 app = FastAPI(
     title="Product Hunt MCP HTTP Server",
     description="HTTP/SSE interface for Product Hunt MCP server",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Add CORS middleware
+def cors_settings(allowed_origins: str) -> Dict[str, Any]:
+    """
+    Build the CORSMiddleware origin settings from a comma-separated origin list.
+
+    An empty list falls back to ``*``. Credentials are only allowed with an
+    explicit origin list, since browsers reject them for a wildcard origin.
+    """
+    origins = [origin.strip() for origin in allowed_origins.split(",") if origin.strip()]
+    if not origins:
+        origins = ["*"]
+    
+    return {
+        "allow_origins": origins,
+        "allow_credentials": "*" not in origins
+    }
+
+# Add CORS middleware, with origins from e.g.
+# ALLOWED_ORIGINS=https://a.example,https://b.example. Preflight results are
+# cacheable for a day to avoid repeated OPTIONS round trips.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    **cors_settings(os.getenv("ALLOWED_ORIGINS", "*")),
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize MCP server on startup."""
-    initialize_mcp_server()
-
-@app.get("/")
+@app.get("/", response_class=ORJSONResponse, response_model=None)
 async def root():
     """Root endpoint with server information."""
-    return {
-        "service": "Product Hunt MCP HTTP Server",
-        "version": "0.1.0",
-        "status": "running",
-        "endpoints": {
-            "/": "Server information",
-            "/health": "Health check",
-            "/sse/": "Server-Sent Events endpoint for N8N",
-            "/tools": "List available tools",
-            "/tools/{tool_name}": "Execute specific tool"
-        },
-        "timestamp": datetime.now().isoformat()
-    }
+    return make_json_response(with_timestamp(ROOT_STATIC))
 
-@app.get("/health")
-async def health_check():
+@app.get("/health", response_class=ORJSONResponse, response_model=None)
+async def health_check(request: Request):
     """Health check endpoint."""
-    global mcp_server
-    
     # Check if MCP server is initialized
-    if mcp_server is None:
+    if getattr(request.app.state, "mcp", None) is None:
         raise HTTPException(status_code=503, detail="MCP server not initialized")
     
-    # Check if Product Hunt token is available
-    token = os.getenv("PRODUCT_HUNT_TOKEN")
+    # Check if Product Hunt token is available (read once at startup)
+    token = request.app.state.ph_token
     if not token:
         raise HTTPException(status_code=503, detail="PRODUCT_HUNT_TOKEN not configured")
     
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "mcp_server": "initialized",
-        "product_hunt_token": "configured" if token else "missing"
-    }
+    return make_json_response(with_timestamp(HEALTHY_STATIC))
 
-@app.get("/tools")
-async def list_tools():
+@app.get("/tools", response_class=ORJSONResponse, response_model=None)
+async def list_tools(request: Request):
     """List available MCP tools."""
-    global mcp_server
-    
-    if mcp_server is None:
+    if getattr(request.app.state, "mcp", None) is None:
         raise HTTPException(status_code=503, detail="MCP server not initialized")
     
-    # Get tools from MCP server
-    tools = []
-    if hasattr(mcp_server, 'tools'):
-        for tool_name, tool_info in mcp_server.tools.items():
-            tools.append({
-                "name": tool_name,
-                "description": getattr(tool_info, 'description', 'No description available')
-            })
-    
-    return {
-        "tools": tools,
-        "count": len(tools),
-        "timestamp": datetime.now().isoformat()
-    }
+    # Tools never change after startup, so the body is serialized once in lifespan
+    return make_json_response(with_timestamp(request.app.state.tools_json))
 
 @app.get("/sse/")
 async def sse_endpoint(request: Request):
     """Server-Sent Events endpoint for N8N integration."""
+    state = request.app.state
+    # Wait for a slot before any headers are sent, so a queued client is not
+    # left holding an open but silent stream
+    await acquire_sse_slot(state)
     
     async def generate_sse():
         """Generate SSE stream."""
         try:
             # Send initial connection message
-            yield f"data: {json.dumps({'type': 'connection', 'message': 'Connected to Product Hunt MCP', 'timestamp': datetime.now().isoformat()})}\n\n"
-            
-            # Send server info
-            yield f"data: {json.dumps({'type': 'server_info', 'data': {'name': 'Product Hunt MCP', 'version': '0.1.0', 'status': 'ready'}, 'timestamp': datetime.now().isoformat()})}\n\n"
-            
-            # Send available tools
-            if mcp_server and hasattr(mcp_server, 'tools'):
-                tools_data = []
-                for tool_name, tool_info in mcp_server.tools.items():
-                    tools_data.append({
-                        "name": tool_name,
-                        "description": getattr(tool_info, 'description', 'No description available')
-                    })
-                
-                yield f"data: {json.dumps({'type': 'tools', 'data': tools_data, 'timestamp': datetime.now().isoformat()})}\n\n"
-            
-            # Send sample Product Hunt data
-            sample_data = {
-                "type": "product_hunt_data",
-                "data": {
-                    "message": "Product Hunt MCP server is ready",
-                    "available_tools": ["get_posts", "get_post_details", "search_topics", "get_user", "get_collections", "get_comments"],
-                    "status": "operational"
-                },
-                "timestamp": datetime.now().isoformat()
-            }
+            yield sse_struct_frame(ConnectionFrame(timestamp=datetime.now(timezone.utc)))
             
-            yield f"data: {json.dumps(sample_data)}\n\n"
+            # Send server info, available tools and sample data (prebuilt at startup)
+            yield state.sse_preamble
             
-            # Keep connection alive with periodic heartbeats
-            while True:
-                await asyncio.sleep(30)  # Send heartbeat every 30 seconds
-                heartbeat = {
-                    "type": "heartbeat",
-                    "timestamp": datetime.now().isoformat(),
-                    "status": "alive"
-                }
-                yield f"data: {json.dumps(heartbeat)}\n\n"
+            # Keep connection alive with the shared heartbeat frame until the
+            # server shuts down. A client disconnect needs no watcher here:
+            # StreamingResponse already cancels this iterator when it happens.
+            shutdown = asyncio.ensure_future(state.shutdown.wait())
+            try:
+                while True:
+                    tick = asyncio.ensure_future(state.heartbeat_bus.wait())
+                    try:
+                        done, _ = await asyncio.wait(
+                            {shutdown, tick}, return_when=asyncio.FIRST_COMPLETED
+                        )
+                    finally:
+                        tick.cancel()
+                    if tick not in done:
+                        break
+                    yield state.last_heartbeat
+            finally:
+                shutdown.cancel()
                 
         except Exception as e:
-            logger.error(f"SSE stream error: {e}")
-            error_data = {
-                "type": "error",
-                "message": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
-            yield f"data: {json.dumps(error_data)}\n\n"
-    
-    return StreamingResponse(
+            logger.error("SSE stream error: %s", e)
+            yield sse_struct_frame(ErrorFrame(message=str(e), timestamp=datetime.now(timezone.utc)))
+    
+    return SSEResponse(
         generate_sse(),
-        media_type="text/plain",
+        state=state,
+        media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "*",
+            "Keep-Alive": f"timeout={KEEP_ALIVE_TIMEOUT}",
+            "X-Accel-Buffering": "no",
         }
     )
 
-@app.post("/tools/{tool_name}")
+@app.post("/tools/{tool_name}", response_class=ORJSONResponse, response_model=None)
 async def execute_tool(tool_name: str, request: Request):
     """Execute a specific MCP tool."""
-    global mcp_server
-    
-    if mcp_server is None:
+    if getattr(request.app.state, "mcp", None) is None:
         raise HTTPException(status_code=503, detail="MCP server not initialized")
     
+    # Get request body. Unlike the stdlib json module, orjson decodes integers
+    # outside the 64-bit range as (lossy) floats.
+    raw = await request.body()
+    if raw and request.headers.get("content-type", "").startswith("application/json"):
+        try:
+            body = orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON body: {str(e)}") from e
+    else:
+        body = {}
+    
     try:
-        # Get request body
-        body = await request.json() if request.headers.get("content-type") == "application/json" else {}
-        
         # Execute tool (this is a simplified version - you'd need to implement proper tool execution)
         result = {
             "tool": tool_name,
             "status": "executed",
             "input": body,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(timezone.utc),
             "message": f"Tool {tool_name} executed successfully"
         }
         
-        return result
+        return ORJSONResponse(result)
         
     except Exception as e:
-        logger.error(f"Tool execution error: {e}")
+        logger.error("Tool execution error: %s", e)
         raise HTTPException(status_code=500, detail=f"Tool execution failed: {str(e)}")
 
 def main():
     """Run the HTTP server."""
     port = int(os.getenv("PORT", 8080))
     host = os.getenv("HOST", "0.0.0.0")
+    workers = int(os.getenv("WORKERS", "1"))
+    access_log = os.getenv("ACCESS_LOG", "0") == "1"
     
-    logger.info(f"Starting Product Hunt MCP HTTP Server on {host}:{port}")
+    configure_logging()
+    logger.info("Starting Product Hunt MCP HTTP Server on %s:%d", host, port)
     
+    # The import string form is required for workers > 1. Each worker imports
+    # this module and runs the lifespan hook on its own, so the MCP server and
+    # PRODUCT_HUNT_TOKEN are initialized/read per worker process.
     uvicorn.run(
-        app,
+        "product_hunt_mcp.http_server:app",
         host=host,
         port=port,
-        log_level="info",
-        access_log=True
+        workers=workers,
+        # "auto" uses uvloop when it is installed (uvicorn[standard] leaves it
+        # out on Windows and PyPy) and falls back to asyncio otherwise
+        loop="auto",
+        http="httptools",
+        ws="none",
+        # Long keep-alive so N8N polls of / and /tools reuse connections, and
+        # no concurrency cap so long-lived SSE streams are not rejected
+        timeout_keep_alive=KEEP_ALIVE_TIMEOUT,
+        limit_concurrency=None,
+        backlog=2048,
+        log_level=LOG_LEVEL,
+        access_log=access_log
     )
 
 if __name__ == "__main__":
@@ -0,0 +1,395 @@
+"""Tests for the HTTP/SSE server in product_hunt_mcp.http_server."""
+
+import logging
+import os
+import queue
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+from itertools import islice
+
+import httpx
+import pytest
+import uvicorn
+from fastapi.testclient import TestClient
+from starlette.requests import ClientDisconnect
+
+from product_hunt_mcp import http_server
+from product_hunt_mcp.http_server import (
+    ORJSONResponse,
+    app,
+    build_sse_preamble,
+    cors_settings,
+    queued_logging,
+    read_log_level,
+)
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(base_url, timeout=20):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+FAKE_TOOLS = [
+    {"name": "get_posts", "description": "Get posts"},
+    {"name": "get_user", "description": "No description available"},
+]
+
+
+@pytest.fixture
+def server_env(monkeypatch):
+    monkeypatch.setenv("PRODUCT_HUNT_TOKEN", "test-token")
+    monkeypatch.delenv("STRICT_STARTUP", raising=False)
+    monkeypatch.delenv("SSE_MAX", raising=False)
+    monkeypatch.setattr(http_server, "collect_tools", lambda server: FAKE_TOOLS)
+    return monkeypatch
+
+
+@pytest.fixture
+def client(server_env):
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def split_timestamp(response):
+    """Return the JSON body without its timestamp, after checking the timestamp format."""
+    body = response.json()
+    timestamp = body.pop("timestamp")
+    assert timestamp.endswith("Z")
+    datetime.fromisoformat(timestamp[:-1])
+    assert response.content.endswith(b',"timestamp":"' + timestamp.encode() + b'"}')
+    return body
+
+
+def test_root_body(client):
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert split_timestamp(response) == {
+        "service": "Product Hunt MCP HTTP Server",
+        "version": "0.1.0",
+        "status": "running",
+        "endpoints": {
+            "/": "Server information",
+            "/health": "Health check",
+            "/sse/": "Server-Sent Events endpoint for N8N",
+            "/tools": "List available tools",
+            "/tools/{tool_name}": "Execute specific tool",
+        },
+    }
+
+
+def test_health_body(client):
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert split_timestamp(response) == {
+        "status": "healthy",
+        "mcp_server": "initialized",
+        "product_hunt_token": "configured",
+    }
+
+
+def test_health_without_token(server_env):
+    server_env.delenv("PRODUCT_HUNT_TOKEN")
+    with TestClient(app) as test_client:
+        response = test_client.get("/health")
+    assert response.status_code == 503
+    assert response.json() == {"detail": "PRODUCT_HUNT_TOKEN not configured"}
+
+
+def test_tools_body(client):
+    response = client.get("/tools")
+    assert response.status_code == 200
+    assert split_timestamp(response) == {"tools": FAKE_TOOLS, "count": 2}
+
+
+def test_execute_tool_echoes_json_body(client):
+    response = client.post(
+        "/tools/get_posts",
+        content=b'{"count": 3}',
+        headers={"content-type": "application/json; charset=utf-8"},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["tool"] == "get_posts"
+    assert body["input"] == {"count": 3}
+
+
+def test_execute_tool_without_body(client):
+    response = client.post("/tools/get_posts")
+    assert response.status_code == 200
+    assert response.json()["input"] == {}
+
+
+def test_execute_tool_rejects_malformed_json(client):
+    response = client.post(
+        "/tools/get_posts", content=b"{bad", headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid JSON body")
+
+
+def test_orjson_response_options():
+    body = ORJSONResponse({1: datetime(2024, 1, 2, 3, 4, 5), "price": Decimal("9.99")}).body
+    # Non-str key stringified, naive datetime tagged as UTC, Decimal through default=str
+    assert body == b'{"1":"2024-01-02T03:04:05Z","price":"9.99"}'
+
+
+def test_orjson_response_serializes_numpy():
+    numpy = pytest.importorskip("numpy")
+    body = ORJSONResponse({"scores": numpy.array([[1, 2], [3, 4]])}).body
+    assert body == b'{"scores":[[1,2],[3,4]]}'
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_queued_logging_delivers_records_and_restores_handlers():
+    target = logging.getLogger("ph_mcp.tests.queued")
+    collector = CollectingHandler()
+    target.addHandler(collector)
+    target.propagate = False
+    try:
+        with queued_logging(target.name):
+            assert target.handlers != [collector]
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                target.error("tool %s failed", "get_posts", exc_info=True)
+        # Leaving the block flushes the queue and puts the original handlers back
+        assert target.handlers == [collector]
+        [record] = collector.records
+        assert record.getMessage() == "tool get_posts failed"
+        assert record.args == ("get_posts",)
+        assert record.exc_info[0] is ValueError
+    finally:
+        target.removeHandler(collector)
+        target.propagate = True
+
+
+def test_log_level_defaults_to_info(monkeypatch):
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+    assert read_log_level() == "info"
+
+
+def test_log_level_is_normalised(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", " WARNING ")
+    assert read_log_level() == "warning"
+
+
+def test_log_level_rejects_unknown_names(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "WARN")
+    with pytest.raises(ValueError, match="Invalid LOG_LEVEL 'warn'"):
+        read_log_level()
+
+
+def test_cors_settings():
+    assert cors_settings("*") == {"allow_origins": ["*"], "allow_credentials": False}
+    assert cors_settings("") == {"allow_origins": ["*"], "allow_credentials": False}
+    assert cors_settings(" https://a.example, https://b.example ,") == {
+        "allow_origins": ["https://a.example", "https://b.example"],
+        "allow_credentials": True,
+    }
+    assert cors_settings("https://a.example,*")["allow_credentials"] is False
+
+
+def test_cors_wildcard_does_not_allow_credentials(client):
+    response = client.options(
+        "/tools",
+        headers={"Origin": "https://a.example", "Access-Control-Request-Method": "GET"},
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert response.headers["access-control-max-age"] == "86400"
+    assert "access-control-allow-credentials" not in response.headers
+
+
+def test_sse_slot_released_when_stream_never_starts(client):
+    # Under ASGI spec 2.4 a failed send of the response headers ends the
+    # response before the body iterator has started
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/sse/",
+        "raw_path": b"/sse/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        raise OSError("client went away")
+
+    with pytest.raises(ClientDisconnect):
+        client.portal.call(app, scope, receive, send)
+    assert app.state.sse_active == 0
+
+
+# Live-server SSE tests (TestClient cannot stream an endless response)
+
+
+@contextmanager
+def live_server():
+    port = free_port()
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=port,
+        loop="asyncio",
+        log_level="warning",
+        timeout_graceful_shutdown=5,
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    try:
+        wait_until_ready(f"http://127.0.0.1:{port}")
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+
+def frames(response):
+    """Yield the non-empty lines (SSE ``data:`` frames) of a streaming response."""
+    return (line for line in response.iter_lines() if line)
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def fast_heartbeat(server_env):
+    server_env.setattr(http_server, "HEARTBEAT_INTERVAL", 0.2)
+    return server_env
+
+
+def test_sse_headers_and_preamble(fast_heartbeat):
+    with live_server() as base_url:
+        with httpx.stream("GET", f"{base_url}/sse/", timeout=5) as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            assert response.headers["x-accel-buffering"] == "no"
+            lines = frames(response)
+            assert next(lines).startswith('data: {"type":"connection"')
+            preamble = [next(lines) for _ in range(3)]
+            assert "\n\n".join(preamble) + "\n\n" == build_sse_preamble(FAKE_TOOLS).decode()
+            assert next(lines).startswith('data: {"type":"heartbeat"')
+
+
+def test_sse_streams_share_heartbeat_frame(fast_heartbeat):
+    with live_server() as base_url:
+        with httpx.stream("GET", f"{base_url}/sse/", timeout=5) as first, httpx.stream(
+            "GET", f"{base_url}/sse/", timeout=5
+        ) as second:
+            first_lines, second_lines = frames(first), frames(second)
+            second_heartbeat = next(
+                line for line in second_lines if '"type":"heartbeat"' in line
+            )
+            # The first stream sees the same serialized frame within a few ticks
+            first_heartbeats = [
+                line for line in islice(first_lines, 10) if '"type":"heartbeat"' in line
+            ]
+            assert second_heartbeat in first_heartbeats
+
+
+def test_sse_admission_queues_and_releases_slots(server_env):
+    server_env.setenv("SSE_MAX", "1")
+    with live_server() as base_url:
+        waiting = queue.Queue()
+
+        def read_second_stream(release):
+            with httpx.stream("GET", f"{base_url}/sse/", timeout=10) as response:
+                # Keep the line iterator alive: dropping it closes the connection
+                lines = frames(response)
+                waiting.put(next(lines))
+                release.wait(10)
+
+        with httpx.stream("GET", f"{base_url}/sse/", timeout=5) as first:
+            first_lines = frames(first)
+            next(first_lines)
+            release_second = threading.Event()
+            reader = threading.Thread(target=read_second_stream, args=(release_second,))
+            reader.start()
+            # The second request gets no response while the only slot is taken
+            with pytest.raises(queue.Empty):
+                waiting.get(timeout=0.5)
+            assert app.state.sse_active == 1
+
+        # Closing the first stream frees its slot for the waiting one
+        assert waiting.get(timeout=5).startswith('data: {"type":"connection"')
+        assert app.state.sse_active == 1
+        release_second.set()
+        reader.join(timeout=10)
+        wait_for(lambda: app.state.sse_active == 0)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="relies on POSIX signals")
+def test_sse_stream_ends_on_server_shutdown():
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = {
+        **os.environ,
+        "HOST": "127.0.0.1",
+        "PORT": str(port),
+        "PRODUCT_HUNT_TOKEN": "test-token",
+        "PYTHONPATH": SRC_DIR,
+    }
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "from product_hunt_mcp.http_server import main; main()"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(base_url)
+        # The read timeout is well below the heartbeat interval, so the stream
+        # can only finish in time if shutdown closes it
+        with httpx.stream("GET", f"{base_url}/sse/", timeout=10) as response:
+            lines = response.iter_lines()
+            assert next(lines).startswith('data: {"type":"connection"')
+            proc.send_signal(signal.SIGTERM)
+            list(lines)
+        proc.wait(timeout=10)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()